@@ -40,7 +40,7 @@ class ComplianceRule:
     weight: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ComplianceResult:
     """Result of a compliance rule evaluation."""
     rule_id: str
@@ -51,7 +51,7 @@ class ComplianceResult:
     recommendations: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class ComplianceReport:
     """Comprehensive BOS methodology compliance report."""
     overall_compliance: float
@@ -7,18 +7,319 @@ against BOS methodology requirements, quality standards, and persona appropriate
 """
 
 import json
+import os
 import re
+import time
 import asyncio
+import hashlib
+import functools
+import threading
+from collections import Counter
+from itertools import repeat
+from operator import attrgetter, mul
+import httpx
 import openai
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, Iterable, List, Any, Optional, Set, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 import logging
 
+# Optional semantic response cache dependencies
+try:
+    import faiss
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    faiss = None
+    SentenceTransformer = None
+
+# HTTP/2 lets concurrent scenario requests share one connection when h2 is installed
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Optional fast JSON serializer for the results file
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional linear-time regex engine for the quantitative content patterns
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Bounds concurrent LLM requests when scenarios are dispatched together
+_MAX_CONCURRENT_LLM_REQUESTS = 5
+
+# Streamed output is re-scored for early termination every this many characters
+_STREAM_CHECK_CHARS = 256
+
+
+# Resolved against this module so the cached prompt does not depend on the working directory
+_BOS_PROMPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "bos_guided_prompt_final.md")
+
+
+@functools.lru_cache(maxsize=None)
+def _read_prompt_file(path: str) -> str:
+    """Read a prompt file once per process; validators share the cached text."""
+    with open(path, "r") as f:
+        return f.read()
+
+
+class _SemanticResponseCache:
+    """Nearest-neighbour cache of LLM responses keyed by embeddings of the execution inputs.
+    
+    Paraphrased scenarios ("500ms SLA on the payment API") reuse the response stored for
+    an earlier equivalent run when the cosine similarity exceeds the threshold.
+    """
+    
+    def __init__(self, cache_dir: str, threshold: float, model_name: str = "all-MiniLM-L6-v2"):
+        self.threshold = threshold
+        self._index_path = os.path.join(cache_dir, "semantic.faiss")
+        self._responses_path = os.path.join(cache_dir, "semantic_responses.json")
+        self._model = SentenceTransformer(model_name)
+        # add() runs in executor threads; the index and response list change together
+        self._lock = threading.Lock()
+        
+        if os.path.exists(self._index_path) and os.path.exists(self._responses_path):
+            self._index = faiss.read_index(self._index_path)
+            with open(self._responses_path, "r") as f:
+                self._responses = json.load(f)
+        else:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._index = faiss.IndexFlatIP(self._model.get_sentence_embedding_dimension())
+            self._responses = []
+    
+    def embed(self, text: str):
+        """Embed text as a normalized float32 row so inner product equals cosine similarity."""
+        return self._model.encode([text], normalize_embeddings=True).astype("float32")
+    
+    def lookup(self, embedding) -> Optional[str]:
+        """Return the stored response nearest to the embedding if it is similar enough."""
+        with self._lock:
+            if not self._responses:
+                return None
+            scores, ids = self._index.search(embedding, 1)
+            if scores[0][0] > self.threshold:
+                return self._responses[ids[0][0]]
+            return None
+    
+    def add(self, embedding, response: str) -> None:
+        """Store a response and persist the index alongside it."""
+        with self._lock:
+            self._index.add(embedding)
+            self._responses.append(response)
+            faiss.write_index(self._index, self._index_path)
+            with open(self._responses_path, "w") as f:
+                json.dump(self._responses, f)
+
+
+_WORD_TOKEN_PATTERN = re.compile(r'\w+')
+
+
+class _TermScanner:
+    """Whole-word matcher for a fixed vocabulary of indicator terms.
+    
+    Single-word terms are looked up in the response's token set; only multi-word
+    or punctuated terms ("next step", "/start") go through the regex alternation.
+    """
+    
+    def __init__(self, terms: List[str]):
+        vocabulary = {term.casefold() for term in terms}
+        # A \w-only term matches \bterm\b exactly when it is a whole token of the response
+        self._words = {term for term in vocabulary if _WORD_TOKEN_PATTERN.fullmatch(term)}
+        # Longest first so the alternation prefers the longest term at each position
+        vocabulary = sorted(vocabulary - self._words, key=len, reverse=True)
+        alternation = "|".join(rf'\b{re.escape(term)}\b' for term in vocabulary)
+        # Zero-width lookahead reports a hit at every position, so overlapping terms are not skipped
+        self._pattern = re.compile(rf'(?=({alternation}))')
+        # Shorter terms that also match wherever a longer term starting at the same position matches
+        self._implied_terms = {
+            term: [other for other in vocabulary
+                   if len(other) < len(term) and re.match(rf'{re.escape(other)}\b', term)]
+            for term in vocabulary
+        }
+    
+    def scan(self, response_folded: str) -> Set[str]:
+        """Return the set of vocabulary terms present in a casefolded response."""
+        found_terms = self._words.intersection(_WORD_TOKEN_PATTERN.findall(response_folded))
+        for match in self._pattern.finditer(response_folded):
+            term = match.group(1)
+            if term not in found_terms:
+                found_terms.add(term)
+                found_terms.update(self._implied_terms[term])
+        return found_terms
+
+
+def _lower_terms(terms: List[str]) -> Tuple[str, ...]:
+    """Casefold indicator terms for lookup against scanned terms."""
+    return tuple(term.casefold() for term in terms)
+
+
+def _build_term_categories(vocabularies: Dict[Tuple[str, ...], Tuple[str, ...]]) -> Dict[str, Tuple[Tuple[str, ...], ...]]:
+    """Invert category vocabularies into a term -> categories dispatch table."""
+    term_categories = {}
+    for category, terms in vocabularies.items():
+        for term in terms:
+            term_categories.setdefault(term, []).append(category)
+    return {term: tuple(categories) for term, categories in term_categories.items()}
+
+
+def _capped_ratio_mean(counts: Iterable[float], targets: Iterable[float]) -> float:
+    """Average count/target ratios with each ratio capped at 1.0."""
+    ratios = [min(count / target, 1.0) for count, target in zip(counts, targets)]
+    return sum(ratios) / len(ratios)
+
+
+def _compile_patterns(patterns: List[str]) -> List[re.Pattern]:
+    """Compile case-insensitive patterns for quantitative content checks.
+    
+    RE2 is used when installed since its automata scan in linear time without backtracking.
+    """
+    if re2 is not None:
+        return [re2.compile(f"(?i){pattern}") for pattern in patterns]
+    return [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+
+
+# Indicator vocabularies, compiled once at import instead of on every response
+COMPLIANCE_INDICATORS = {
+    "step_references": [
+        "WHO depends", "WHAT they expect", "WHAT breaks",
+        "WHAT telemetry", "WHAT signals", "PLAYBOOK", "DASHBOARD"
+    ],
+    "framework_structure": [
+        "stakeholder", "dependency", "impact", "telemetry", "signal"
+    ],
+    "methodology_commands": [
+        "/start", "/persona", "/step", "/validate", "/generate"
+    ],
+    "progression_logic": [
+        "Step 1", "Step 2", "Step 3", "next step", "proceed to"
+    ]
+}
+
+PERSONA_INDICATORS = {
+    "product_owner": {
+        "business_language": ["business", "stakeholder", "impact", "value", "requirement"],
+        "avoid_technical": ["API", "database", "server", "code", "implementation"],
+        "focus_areas": ["process", "outcome", "measurement", "expectation"]
+    },
+    "developer": {
+        "technical_language": ["API", "service", "observable", "telemetry", "signal"],
+        "implementation_focus": ["code", "system", "integration", "measurement"],
+        "avoid_business_jargon": ["ROI", "business case", "strategy"]
+    },
+    "platform_sre": {
+        "infrastructure_language": ["system", "platform", "monitoring", "infrastructure"],
+        "operational_focus": ["health", "performance", "reliability", "dashboard"],
+        "technical_precision": ["metric", "threshold", "alert", "SLA"]
+    }
+}
+
+STAKEHOLDER_CATEGORIES = {
+    "people": ["role", "team", "person", "individual", "staff"],
+    "business_entities": ["department", "organization", "customer", "client"],
+    "vendors": ["vendor", "supplier", "provider", "contractor", "third-party"]
+}
+
+TECHNICAL_TERMS = {
+    "developer": ["observable unit", "telemetry", "signal", "metric", "instrumentation"],
+    "platform_sre": ["dashboard", "monitoring", "alert", "threshold", "SLA"]
+}
+
+CLARITY_INDICATORS = ["please", "next", "complete", "provide", "identify", "define"]
+
+ACTION_WORDS = ["identify", "define", "specify", "map", "analyze", "create", "generate"]
+
+# Read-only lowercase views of the vocabularies used by the validators
+_METHODOLOGY_TERMS = MappingProxyType({
+    category: _lower_terms(terms) for category, terms in COMPLIANCE_INDICATORS.items()
+})
+# Per persona: (category, terms, is_penalty) triples, with "avoid_*" categories flagged as penalties up front
+_PERSONA_TERMS = MappingProxyType({
+    persona: tuple(
+        (category, _lower_terms(terms), category.startswith("avoid_")) for category, terms in indicators.items()
+    )
+    for persona, indicators in PERSONA_INDICATORS.items()
+})
+_STAKEHOLDER_TERMS = MappingProxyType({
+    category: _lower_terms(terms) for category, terms in STAKEHOLDER_CATEGORIES.items()
+})
+_TECHNICAL_TERMS = MappingProxyType({
+    persona: _lower_terms(terms) for persona, terms in TECHNICAL_TERMS.items()
+})
+_CLARITY_TERMS = _lower_terms(CLARITY_INDICATORS)
+_ACTION_TERMS = _lower_terms(ACTION_WORDS)
+
+# Every indicator vocabulary keyed by the count it feeds, e.g. ("stakeholder", "vendors")
+_CATEGORY_VOCABULARIES = {
+    **{("methodology", category): terms for category, terms in _METHODOLOGY_TERMS.items()},
+    **{("persona", persona, category): terms
+       for persona, indicators in _PERSONA_TERMS.items() for category, terms, _ in indicators},
+    **{("stakeholder", category): terms for category, terms in _STAKEHOLDER_TERMS.items()},
+    **{("technical", persona): terms for persona, terms in _TECHNICAL_TERMS.items()},
+    ("clarity",): _CLARITY_TERMS,
+    ("action",): _ACTION_TERMS
+}
+_TERM_CATEGORIES = _build_term_categories(_CATEGORY_VOCABULARIES)
+
+# One scanner over every indicator vocabulary, run once per response
+_INDICATOR_SCANNER = _TermScanner(list(_TERM_CATEGORIES))
+
+_MEASURABLE_PATTERNS = _compile_patterns([
+    r'\d+(?:\.\d+)?\s*%',  # Percentages
+    r'\d+(?:\.\d+)?\s*(second|minute|hour|day)s?',  # Time units
+    r'\$\d+(?:,\d{3})*(?:\.\d{2})?',  # Dollar amounts
+    r'\d+(?:\.\d+)?\s*(ms|sec|min|hr|SLA)'  # Technical units
+])
+_TIME_PATTERNS = _compile_patterns([
+    r'\d+\s*(second|minute|hour|day|week|month)s?',
+    r'within\s+\d+',
+    r'by\s+\d+',
+    r'real.?time',
+    r'immediately'
+])
+# Gaps are bounded so a long line cannot make the lazy scans quadratic
+_IMPACT_PATTERNS = _compile_patterns([
+    r'revenue[^\n]{0,120}?\$\d+',
+    r'cost[^\n]{0,120}?\$\d+',
+    r'loss[^\n]{0,120}?\$\d+',
+    r'\d[^\n]{0,80}?customer',
+    r'\d[^\n]{0,80}?user',
+    r'efficiency[^\n]{0,120}?\d+%'
+])
+_QUANTITATIVE_PATTERNS = {
+    "measurable_values": _MEASURABLE_PATTERNS,
+    "specific_timeframes": _TIME_PATTERNS,
+    "quantified_impacts": _IMPACT_PATTERNS
+}
+
+# Validation categories in scoring order; weights, criteria and suggestions are parallel to it
+_SCORE_CATEGORIES = ("methodology", "persona", "quality", "stakeholder", "technical")
+_CATEGORY_WEIGHTS = (0.25, 0.20, 0.20, 0.20, 0.15)
+_CATEGORY_THRESHOLDS = attrgetter(
+    "methodology_adherence",
+    "persona_guidance_relevance",
+    "specificity_threshold",
+    "stakeholder_category_coverage",
+    "technical_accuracy"
+)
+_CATEGORY_SUGGESTIONS = (
+    "Improve BOS methodology framework adherence",
+    "Enhance persona-specific guidance appropriateness",
+    "Increase specificity and measurability of guidance",
+    "Improve stakeholder framework coverage",
+    "Enhance technical precision for the target persona"
+)
+
 
 class LLMProvider(Enum):
     OPENAI_GPT4 = "openai_gpt4"
@@ -34,6 +335,17 @@ class PromptExecution:
     temperature: float = 0.7
     max_tokens: int = 2000
     timeout: int = 30
+    # Cancel a streamed response scoring below early_stop_score once this share of max_tokens has arrived
+    early_stop_score: float = 0.3
+    early_stop_fraction: float = 0.3
+    # On-disk result cache, only used for deterministic (temperature == 0) runs
+    cache_dir: Optional[str] = ".prompt_cache"
+    cache_ttl: int = 86400
+    # Opt-in reuse of responses for paraphrased inputs; needs faiss and sentence-transformers,
+    # a cache_dir and temperature <= 0.2, so it stays off at the default temperature
+    semantic_cache: bool = False
+    # Minimum cosine similarity for a semantic cache hit
+    semantic_cache_threshold: float = 0.92
 
 
 @dataclass
@@ -79,12 +391,16 @@ class BOS_PromptResponseValidator:
         self.execution_config = execution_config
         self.criteria = validation_criteria
         self.bos_prompt = self._load_bos_prompt()
+        self.semantic_cache: Optional[_SemanticResponseCache] = None
+        # Connection pool and request bound belong to the event loop that created them; see aclose()
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._openai_client: Optional[openai.AsyncOpenAI] = None
+        self._llm_semaphore: Optional[asyncio.Semaphore] = None
         
     def _load_bos_prompt(self) -> str:
         """Load the BOS methodology prompt from file."""
         try:
-            with open("../bos_guided_prompt_final.md", "r") as f:
-                return f.read()
+            return _read_prompt_file(_BOS_PROMPT_PATH)
         except FileNotFoundError:
             logger.error("BOS prompt file not found")
             return ""
@@ -95,16 +411,39 @@ class BOS_PromptResponseValidator:
                                         persona: str) -> Dict[str, Any]:
         """Execute prompt with LLM and validate the response."""
         
-        # Prepare prompt context
-        full_prompt = self._prepare_prompt_context(test_scenario, persona)
+        # Reuse a previous result for identical deterministic inputs
+        cache_path = self._cache_path(test_scenario, persona, user_inputs)
+        if cache_path:
+            cached = self._load_cached_result(cache_path)
+            if cached is not None:
+                return cached
         
-        # Execute prompt with LLM
-        response = await self._execute_prompt(full_prompt, user_inputs)
-        
-        # Validate response
-        validation_results = self._validate_response(response, persona, test_scenario)
+        # Prepare prompt context
+        prompt_messages = self._prepare_prompt_context(test_scenario, persona)
+        
+        # Execute prompt with LLM, unless a paraphrase of these inputs was answered before
+        loop = asyncio.get_running_loop()
+        response = None
+        complete = True
+        if self.semantic_cache:
+            # Embedding is model inference, so it runs off the event loop like validation below
+            embedding = await loop.run_in_executor(
+                None, self.semantic_cache.embed, " ".join(user_inputs) + "|" + persona + "|" + test_scenario
+            )
+            response = self.semantic_cache.lookup(embedding)
+        if response is None:
+            response, complete = await self._execute_prompt(prompt_messages, user_inputs, persona, test_scenario)
+            # The semantic cache never expires, so only complete responses may enter it
+            if self.semantic_cache and complete:
+                # Persisting the index is file I/O, so it also stays off the event loop
+                await loop.run_in_executor(None, self.semantic_cache.add, embedding, response)
+        
+        # Validate response off the event loop so concurrent scenarios keep streaming
+        validation_results = await loop.run_in_executor(
+            None, self._validate_response, response, persona, test_scenario
+        )
         
-        return {
+        result = {
             "scenario": test_scenario,
             "persona": persona,
             "inputs": user_inputs,
@@ -114,66 +453,186 @@ class BOS_PromptResponseValidator:
                 "provider": self.execution_config.provider.value,
                 "model": self.execution_config.model,
                 "response_length": len(response),
-                "timestamp": asyncio.get_event_loop().time()
+                "timestamp_ns": time.perf_counter_ns()
             }
         }
-    
-    def _prepare_prompt_context(self, scenario: str, persona: str) -> str:
-        """Prepare the complete prompt context for execution."""
-        context = f"""
-{self.bos_prompt}
-
+        
+        # Errors and early-stopped partial responses are not worth replaying from the cache
+        if cache_path and complete:
+            self._store_cached_result(cache_path, result)
+        
+        return result
+    
+    def validate_responses(self, responses: List[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
+        """Validate a batch of (response, persona, scenario) triples without executing prompts.
+        
+        Identical triples are validated once and share the same result, which keeps
+        regression re-grading of stored runs proportional to the distinct responses.
+        """
+        validations = {}
+        for item in responses:
+            if item not in validations:
+                validations[item] = self._validate_response(*item)
+        return [validations[item] for item in responses]
+    
+    def _cache_path(self, scenario: str, persona: str, user_inputs: List[str]) -> Optional[str]:
+        """Return the cache file for these execution inputs, or None when caching is disabled."""
+        config = self.execution_config
+        if not config.cache_dir or config.temperature != 0:
+            return None
+        
+        key = hashlib.sha256(json.dumps(
+            [scenario, persona, user_inputs, config.model, config.temperature],
+            sort_keys=True
+        ).encode()).hexdigest()
+        return os.path.join(config.cache_dir, f"{key}.json")
+    
+    def _load_cached_result(self, cache_path: str) -> Optional[Dict[str, Any]]:
+        """Load a cached result if it exists and is younger than the configured TTL."""
+        try:
+            if time.time() - os.path.getmtime(cache_path) > self.execution_config.cache_ttl:
+                return None
+            with open(cache_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _store_cached_result(self, cache_path: str, result: Dict[str, Any]) -> None:
+        """Persist a result to the on-disk cache."""
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, "w") as f:
+                json.dump(result, f, default=str)
+        except OSError as e:
+            logger.warning(f"Could not write response cache: {e}")
+    
+    def _prepare_prompt_context(self, scenario: str, persona: str) -> List[Dict[str, Any]]:
+        """Prepare the prompt context as system messages for execution.
+        
+        The BOS prompt is kept verbatim as the first message so it forms an identical
+        prefix across scenarios and runs, which provider prompt caching can reuse.
+        Scenario and persona details follow in a separate message.
+        """
+        scenario_context = f"""
 TESTING SCENARIO: {scenario}
 ACTIVE PERSONA: {persona}
 
 Please respond as the BOS methodology facilitator for this scenario.
 """
-        return context
+        return [
+            {"role": "system", "content": self.bos_prompt},
+            {"role": "system", "content": scenario_context}
+        ]
     
-    async def _execute_prompt(self, prompt: str, user_inputs: List[str]) -> str:
-        """Execute the prompt with the configured LLM provider."""
+    async def _execute_prompt(self, prompt_messages: List[Dict[str, Any]], user_inputs: List[str],
+                              persona: str, scenario: str) -> Tuple[str, bool]:
+        """Execute the prompt with the configured LLM provider.
+        
+        Returns the response text and whether it is a complete, successful response;
+        errors, placeholders and streams stopped early report False.
+        """
         
         if self.execution_config.provider == LLMProvider.OPENAI_GPT4:
-            return await self._execute_openai_prompt(prompt, user_inputs)
+            return await self._execute_openai_prompt(prompt_messages, user_inputs, persona, scenario)
         elif self.execution_config.provider == LLMProvider.ANTHROPIC_CLAUDE:
-            return await self._execute_anthropic_prompt(prompt, user_inputs)
+            return await self._execute_anthropic_prompt(prompt_messages, user_inputs)
         else:
             raise ValueError(f"Unsupported LLM provider: {self.execution_config.provider}")
     
-    async def _execute_openai_prompt(self, prompt: str, user_inputs: List[str]) -> str:
-        """Execute prompt using OpenAI GPT-4."""
+    def _get_openai_client(self) -> openai.AsyncOpenAI:
+        """Return the shared OpenAI client, creating it on first use."""
+        if self._openai_client is None:
+            # One pooled client for every scenario avoids a fresh connection and TLS handshake per call
+            self._http_client = httpx.AsyncClient(
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=20)
+            )
+            self._openai_client = openai.AsyncOpenAI(http_client=self._http_client)
+        return self._openai_client
+    
+    def _get_llm_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore bounding concurrent LLM requests, creating it on first use."""
+        if self._llm_semaphore is None:
+            self._llm_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_LLM_REQUESTS)
+        return self._llm_semaphore
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and drop the loop-bound request state.
+        
+        The next execution creates fresh ones, so the validator can be reused
+        under a later event loop (e.g. a second asyncio.run).
+        """
+        http_client = self._http_client
+        self._http_client = None
+        self._openai_client = None
+        self._llm_semaphore = None
+        if http_client is not None:
+            await http_client.aclose()
+    
+    async def _execute_openai_prompt(self, prompt_messages: List[Dict[str, Any]], user_inputs: List[str],
+                                     persona: str, scenario: str) -> Tuple[str, bool]:
+        """Execute prompt using OpenAI GPT-4, streaming and stopping early on clear failures."""
         try:
-            # Build conversation
-            messages = [
-                {"role": "system", "content": prompt}
+            # Send every user turn in one conversation; only the final reply is validated
+            # OpenAI caches the shared BOS prompt prefix automatically
+            messages = prompt_messages + [
+                {"role": "user", "content": user_input} for user_input in user_inputs
             ]
             
-            for user_input in user_inputs:
-                messages.append({"role": "user", "content": user_input})
-                
-                # Get response
-                response = await openai.ChatCompletion.acreate(
-                    model=self.execution_config.model,
+            config = self.execution_config
+            min_tokens_before_stop = config.max_tokens * config.early_stop_fraction
+            chunks = []
+            received_tokens = 0
+            unchecked_chars = 0
+            
+            loop = asyncio.get_running_loop()
+            client = self._get_openai_client()
+            async with self._get_llm_semaphore():
+                response = await client.chat.completions.create(
+                    model=config.model,
                     messages=messages,
-                    temperature=self.execution_config.temperature,
-                    max_tokens=self.execution_config.max_tokens,
-                    timeout=self.execution_config.timeout
+                    temperature=config.temperature,
+                    max_tokens=config.max_tokens,
+                    timeout=config.timeout,
+                    stream=True
                 )
                 
-                assistant_response = response.choices[0].message.content
-                messages.append({"role": "assistant", "content": assistant_response})
+                async for chunk in response:
+                    if not chunk.choices:
+                        continue
+                    content = chunk.choices[0].delta.content
+                    # Role and finish chunks carry no content and do not advance the response
+                    if not content:
+                        continue
+                    chunks.append(content)
+                    received_tokens += 1  # Each content delta carries roughly one token
+                    unchecked_chars += len(content)
+                    
+                    if unchecked_chars >= _STREAM_CHECK_CHARS and received_tokens > min_tokens_before_stop:
+                        unchecked_chars = 0
+                        # Scored off the event loop so the other scenarios keep streaming meanwhile
+                        partial_validation = await loop.run_in_executor(
+                            None, self._validate_response, "".join(chunks), persona, scenario
+                        )
+                        partial_score = partial_validation["overall_score"]
+                        if partial_score < config.early_stop_score:
+                            logger.info(f"Stopping stream early: partial score {partial_score:.2f} "
+                                        f"after {received_tokens} tokens")
+                            await response.close()
+                            return "".join(chunks), False
             
-            return assistant_response
+            return "".join(chunks), True
             
         except Exception as e:
             logger.error(f"OpenAI execution error: {e}")
-            return f"ERROR: {str(e)}"
+            return f"ERROR: {str(e)}", False
     
-    async def _execute_anthropic_prompt(self, prompt: str, user_inputs: List[str]) -> str:
+    async def _execute_anthropic_prompt(self, prompt_messages: List[Dict[str, Any]],
+                                        user_inputs: List[str]) -> Tuple[str, bool]:
         """Execute prompt using Anthropic Claude."""
         # Placeholder for Anthropic API integration
         logger.info("Anthropic Claude execution not yet implemented")
-        return "SIMULATED_RESPONSE: Claude integration pending"
+        return "SIMULATED_RESPONSE: Claude integration pending", False
     
     def _validate_response(self, response: str, persona: str, scenario: str) -> Dict[str, Any]:
         """Comprehensive validation of prompt response."""
@@ -187,254 +646,120 @@ Please respond as the BOS methodology facilitator for this scenario.
             "improvement_suggestions": []
         }
         
-        # 1. BOS Methodology Compliance Validation
-        methodology_score = self._validate_methodology_compliance(response)
-        validation_results["category_scores"]["methodology"] = methodology_score
-        
-        # 2. Persona Appropriateness Validation
-        persona_score = self._validate_persona_appropriateness(response, persona)
-        validation_results["category_scores"]["persona"] = persona_score
-        
-        # 3. Content Quality Validation
-        quality_score = self._validate_content_quality(response)
-        validation_results["category_scores"]["quality"] = quality_score
-        
-        # 4. Stakeholder Framework Validation
-        stakeholder_score = self._validate_stakeholder_framework(response)
-        validation_results["category_scores"]["stakeholder"] = stakeholder_score
-        
-        # 5. Technical Precision Validation
-        technical_score = self._validate_technical_precision(response, persona)
-        validation_results["category_scores"]["technical"] = technical_score
+        # Scan the response once; every validator below only reads the resulting counts
+        counts = self._scan_all(response)
+        
+        # Category scores, ordered as _SCORE_CATEGORIES
+        scores = (
+            # 1. BOS Methodology Compliance Validation
+            self._validate_methodology_from_counts(counts),
+            # 2. Persona Appropriateness Validation
+            self._validate_persona_from_counts(counts, persona),
+            # 3. Content Quality Validation
+            self._validate_content_quality_from_counts(counts),
+            # 4. Stakeholder Framework Validation
+            self._validate_stakeholder_from_counts(counts),
+            # 5. Technical Precision Validation
+            self._validate_technical_from_counts(counts, persona)
+        )
+        validation_results["category_scores"] = dict(zip(_SCORE_CATEGORIES, scores))
         
         # Calculate overall score
-        category_weights = {
-            "methodology": 0.25,
-            "persona": 0.20,
-            "quality": 0.20,
-            "stakeholder": 0.20,
-            "technical": 0.15
-        }
-        
-        validation_results["overall_score"] = sum(
-            validation_results["category_scores"][cat] * weight 
-            for cat, weight in category_weights.items()
-        )
+        validation_results["overall_score"] = sum(map(mul, scores, _CATEGORY_WEIGHTS))
         
         # Generate improvement suggestions
-        validation_results["improvement_suggestions"] = self._generate_improvement_suggestions(
-            validation_results["category_scores"]
-        )
+        validation_results["improvement_suggestions"] = self._generate_improvement_suggestions(scores)
         
         return validation_results
     
-    def _validate_methodology_compliance(self, response: str) -> float:
+    def _scan_all(self, response: str) -> Counter:
+        """Count indicator hits per vocabulary category and quantitative matches per metric."""
+        counts = Counter()
+        for term in _INDICATOR_SCANNER.scan(response.casefold()):
+            counts.update(_TERM_CATEGORIES[term])
+        counts.update(self._count_quantitative_content(response))
+        return counts
+    
+    def _validate_methodology_from_counts(self, counts: Counter) -> float:
         """Validate adherence to BOS methodology framework."""
-        compliance_indicators = {
-            "step_references": [
-                "WHO depends", "WHAT they expect", "WHAT breaks",
-                "WHAT telemetry", "WHAT signals", "PLAYBOOK", "DASHBOARD"
-            ],
-            "framework_structure": [
-                "stakeholder", "dependency", "impact", "telemetry", "signal"
-            ],
-            "methodology_commands": [
-                "/start", "/persona", "/step", "/validate", "/generate"
-            ],
-            "progression_logic": [
-                "Step 1", "Step 2", "Step 3", "next step", "proceed to"
-            ]
-        }
-        
-        scores = {}
-        for category, indicators in compliance_indicators.items():
-            found_count = sum(1 for indicator in indicators 
-                            if re.search(rf'\b{re.escape(indicator)}\b', response, re.IGNORECASE))
-            scores[category] = min(found_count / len(indicators), 1.0)
-        
-        return sum(scores.values()) / len(scores)
+        return _capped_ratio_mean(
+            (counts["methodology", category] for category in _METHODOLOGY_TERMS),
+            map(len, _METHODOLOGY_TERMS.values())
+        )
     
-    def _validate_persona_appropriateness(self, response: str, persona: str) -> float:
+    def _validate_persona_from_counts(self, counts: Counter, persona: str) -> float:
         """Validate persona-specific guidance appropriateness."""
-        persona_indicators = {
-            "product_owner": {
-                "business_language": ["business", "stakeholder", "impact", "value", "requirement"],
-                "avoid_technical": ["API", "database", "server", "code", "implementation"],
-                "focus_areas": ["process", "outcome", "measurement", "expectation"]
-            },
-            "developer": {
-                "technical_language": ["API", "service", "observable", "telemetry", "signal"],
-                "implementation_focus": ["code", "system", "integration", "measurement"],
-                "avoid_business_jargon": ["ROI", "business case", "strategy"]
-            },
-            "platform_sre": {
-                "infrastructure_language": ["system", "platform", "monitoring", "infrastructure"],
-                "operational_focus": ["health", "performance", "reliability", "dashboard"],
-                "technical_precision": ["metric", "threshold", "alert", "SLA"]
-            }
-        }
-        
-        if persona not in persona_indicators:
+        indicators = _PERSONA_TERMS.get(persona)
+        if indicators is None:
             return 0.5  # Unknown persona
         
-        indicators = persona_indicators[persona]
-        scores = {}
+        scores = []
         
         # Check for appropriate language
-        for category, terms in indicators.items():
-            if category.startswith("avoid_"):
+        for category, terms, is_penalty in indicators:
+            found_count = counts["persona", persona, category]
+            if is_penalty:
                 # Penalty for inappropriate terms
-                penalty_count = sum(1 for term in terms 
-                                  if re.search(rf'\b{re.escape(term)}\b', response, re.IGNORECASE))
-                scores[category] = max(0, 1.0 - (penalty_count * 0.2))
+                scores.append(max(0, 1.0 - (found_count * 0.2)))
             else:
                 # Reward for appropriate terms
-                found_count = sum(1 for term in terms 
-                                if re.search(rf'\b{re.escape(term)}\b', response, re.IGNORECASE))
-                scores[category] = min(found_count / len(terms), 1.0)
+                scores.append(min(found_count / len(terms), 1.0))
         
-        return sum(scores.values()) / len(scores)
+        return sum(scores) / len(scores)
     
-    def _validate_content_quality(self, response: str) -> float:
+    def _validate_content_quality_from_counts(self, counts: Counter) -> float:
         """Validate content quality and specificity."""
-        quality_metrics = {
-            "measurable_values": self._count_measurable_values(response),
-            "specific_timeframes": self._count_time_references(response),
-            "quantified_impacts": self._count_quantified_impacts(response),
-            "clear_instructions": self._assess_instruction_clarity(response),
-            "actionable_guidance": self._assess_actionability(response)
-        }
-        
-        # Normalize scores (implementation depends on specific counting logic)
-        normalized_scores = {}
-        for metric, value in quality_metrics.items():
-            # Simple normalization - adjust based on expected ranges
-            normalized_scores[metric] = min(value / 5.0, 1.0)  # Assuming 5 is a good target
+        quality_metrics = {metric: counts[metric] for metric in _QUANTITATIVE_PATTERNS}
+        quality_metrics["clear_instructions"] = self._assess_instruction_clarity(counts)
+        quality_metrics["actionable_guidance"] = self._assess_actionability(counts)
         
-        return sum(normalized_scores.values()) / len(normalized_scores)
+        # Simple normalization - adjust based on expected ranges
+        return _capped_ratio_mean(quality_metrics.values(), repeat(5.0))  # Assuming 5 is a good target
     
-    def _validate_stakeholder_framework(self, response: str) -> float:
+    def _validate_stakeholder_from_counts(self, counts: Counter) -> float:
         """Validate stakeholder framework coverage."""
-        stakeholder_categories = {
-            "people": ["role", "team", "person", "individual", "staff"],
-            "business_entities": ["department", "organization", "customer", "client"],
-            "vendors": ["vendor", "supplier", "provider", "contractor", "third-party"]
-        }
-        
-        category_coverage = {}
-        for category, terms in stakeholder_categories.items():
-            mentions = sum(1 for term in terms 
-                          if re.search(rf'\b{re.escape(term)}\b', response, re.IGNORECASE))
-            category_coverage[category] = min(mentions / 2.0, 1.0)  # Target 2 mentions per category
-        
-        return sum(category_coverage.values()) / len(category_coverage)
+        return _capped_ratio_mean(
+            (counts["stakeholder", category] for category in _STAKEHOLDER_TERMS),
+            repeat(2.0)  # Target 2 mentions per category
+        )
     
-    def _validate_technical_precision(self, response: str, persona: str) -> float:
+    def _validate_technical_from_counts(self, counts: Counter, persona: str) -> float:
         """Validate technical precision appropriate for persona."""
-        if persona == "developer":
-            technical_terms = ["observable unit", "telemetry", "signal", "metric", "instrumentation"]
-            precision_score = sum(1 for term in technical_terms 
-                                if re.search(rf'\b{re.escape(term)}\b', response, re.IGNORECASE))
-            return min(precision_score / len(technical_terms), 1.0)
-        
-        elif persona == "platform_sre":
-            infrastructure_terms = ["dashboard", "monitoring", "alert", "threshold", "SLA"]
-            precision_score = sum(1 for term in infrastructure_terms 
-                                if re.search(rf'\b{re.escape(term)}\b', response, re.IGNORECASE))
-            return min(precision_score / len(infrastructure_terms), 1.0)
-        
-        else:
+        terms = _TECHNICAL_TERMS.get(persona)
+        if terms is None:
             # For product owner, technical precision is less critical
             return 0.8  # Default reasonable score
+        
+        precision_score = counts["technical", persona]
+        return min(precision_score / len(terms), 1.0)
     
     # Helper methods for quality assessment
-    def _count_measurable_values(self, response: str) -> int:
-        """Count measurable values in response."""
-        patterns = [
-            r'\d+(?:\.\d+)?\s*%',  # Percentages
-            r'\d+(?:\.\d+)?\s*(second|minute|hour|day)s?',  # Time units
-            r'\$\d+(?:,\d{3})*(?:\.\d{2})?',  # Dollar amounts
-            r'\d+(?:\.\d+)?\s*(ms|sec|min|hr|SLA)'  # Technical units
-        ]
-        
-        count = 0
-        for pattern in patterns:
-            count += len(re.findall(pattern, response, re.IGNORECASE))
-        return count
-    
-    def _count_time_references(self, response: str) -> int:
-        """Count specific time references."""
-        time_patterns = [
-            r'\d+\s*(second|minute|hour|day|week|month)s?',
-            r'within\s+\d+',
-            r'by\s+\d+',
-            r'real.?time',
-            r'immediately'
-        ]
-        
-        count = 0
-        for pattern in time_patterns:
-            count += len(re.findall(pattern, response, re.IGNORECASE))
-        return count
-    
-    def _count_quantified_impacts(self, response: str) -> int:
-        """Count quantified business impacts."""
-        impact_patterns = [
-            r'revenue.*?\$\d+',
-            r'cost.*?\$\d+',
-            r'loss.*?\$\d+',
-            r'\d+.*?customer',
-            r'\d+.*?user',
-            r'efficiency.*?\d+%'
-        ]
-        
-        count = 0
-        for pattern in impact_patterns:
-            count += len(re.findall(pattern, response, re.IGNORECASE))
-        return count
+    def _count_quantitative_content(self, response: str) -> Dict[str, int]:
+        """Count measurable values, time references and quantified impacts in response."""
+        return {
+            metric: sum(len(pattern.findall(response)) for pattern in patterns)
+            for metric, patterns in _QUANTITATIVE_PATTERNS.items()
+        }
     
-    def _assess_instruction_clarity(self, response: str) -> float:
+    def _assess_instruction_clarity(self, counts: Counter) -> float:
         """Assess clarity of instructions provided."""
-        clarity_indicators = [
-            "please", "next", "complete", "provide", "identify", "define"
-        ]
-        
-        found_indicators = sum(1 for indicator in clarity_indicators 
-                             if re.search(rf'\b{re.escape(indicator)}\b', response, re.IGNORECASE))
+        found_indicators = counts[("clarity",)]
         
         return min(found_indicators / 3.0, 1.0)  # Target 3 clear instructions
     
-    def _assess_actionability(self, response: str) -> float:
+    def _assess_actionability(self, counts: Counter) -> float:
         """Assess actionability of guidance."""
-        action_words = [
-            "identify", "define", "specify", "map", "analyze", "create", "generate"
-        ]
-        
-        action_count = sum(1 for word in action_words 
-                          if re.search(rf'\b{re.escape(word)}\b', response, re.IGNORECASE))
+        action_count = counts[("action",)]
         
         return min(action_count / 4.0, 1.0)  # Target 4 actionable items
     
-    def _generate_improvement_suggestions(self, category_scores: Dict[str, float]) -> List[str]:
-        """Generate specific improvement suggestions based on scores."""
-        suggestions = []
-        
-        if category_scores.get("methodology", 0) < self.criteria.methodology_adherence:
-            suggestions.append("Improve BOS methodology framework adherence")
-        
-        if category_scores.get("persona", 0) < self.criteria.persona_guidance_relevance:
-            suggestions.append("Enhance persona-specific guidance appropriateness")
-        
-        if category_scores.get("quality", 0) < self.criteria.specificity_threshold:
-            suggestions.append("Increase specificity and measurability of guidance")
-        
-        if category_scores.get("stakeholder", 0) < self.criteria.stakeholder_category_coverage:
-            suggestions.append("Improve stakeholder framework coverage")
-        
-        if category_scores.get("technical", 0) < self.criteria.technical_accuracy:
-            suggestions.append("Enhance technical precision for the target persona")
-        
-        return suggestions
+    def _generate_improvement_suggestions(self, scores: Tuple[float, ...]) -> List[str]:
+        """Generate specific improvement suggestions for category scores below their criteria."""
+        return [
+            suggestion
+            for score, threshold, suggestion in zip(scores, _CATEGORY_THRESHOLDS(self.criteria), _CATEGORY_SUGGESTIONS)
+            if score < threshold
+        ]
 
 
 # Test execution class
@@ -450,6 +775,15 @@ class AutomatedPromptTester:
             ),
             validation_criteria=ValidationCriteria()
         )
+        
+        # Semantic caching is opt-in and only makes sense for near-deterministic sampling
+        config = self.validator.execution_config
+        if config.semantic_cache and SentenceTransformer is None:
+            logger.warning("Semantic cache requested but faiss/sentence-transformers are not installed")
+        elif config.semantic_cache and config.cache_dir and config.temperature <= 0.2:
+            self.validator.semantic_cache = _SemanticResponseCache(
+                config.cache_dir, config.semantic_cache_threshold
+            )
     
     async def run_automated_test_suite(self) -> Dict[str, Any]:
         """Run comprehensive automated test suite."""
@@ -487,17 +821,22 @@ class AutomatedPromptTester:
             }
         ]
         
-        results = []
         for scenario in test_scenarios:
             logger.info(f"Executing test: {scenario['name']}")
-            
-            result = await self.validator.execute_and_validate_prompt(
-                scenario["scenario"],
-                scenario["inputs"],
-                scenario["persona"]
-            )
-            
-            results.append(result)
+        
+        # Scenarios are independent, so run them concurrently (bounded by _MAX_CONCURRENT_LLM_REQUESTS)
+        try:
+            results = await asyncio.gather(*(
+                self.validator.execute_and_validate_prompt(
+                    scenario["scenario"],
+                    scenario["inputs"],
+                    scenario["persona"]
+                )
+                for scenario in test_scenarios
+            ))
+        finally:
+            # The client and semaphore are bound to this run's event loop
+            await self.validator.aclose()
         
         # Generate comprehensive report
         return self._generate_test_report(results)
@@ -520,16 +859,14 @@ class AutomatedPromptTester:
     
     def _aggregate_recommendations(self, results: List[Dict]) -> List[str]:
         """Aggregate improvement recommendations across all tests."""
-        all_suggestions = []
-        for result in results:
-            all_suggestions.extend(result["validation"]["improvement_suggestions"])
-        
         # Count frequency and return most common suggestions
-        suggestion_counts = {}
-        for suggestion in all_suggestions:
-            suggestion_counts[suggestion] = suggestion_counts.get(suggestion, 0) + 1
+        suggestion_counts = Counter(
+            suggestion
+            for result in results
+            for suggestion in result["validation"]["improvement_suggestions"]
+        )
         
-        return sorted(suggestion_counts.keys(), key=lambda x: suggestion_counts[x], reverse=True)
+        return [suggestion for suggestion, _ in suggestion_counts.most_common()]
 
 
 # Main execution
@@ -546,8 +883,12 @@ async def main():
     print(f"📈 Average Score: {results['summary']['average_score']:.1%}")
     
     # Save results
-    with open("prompt_validation_results.json", "w") as f:
-        json.dump(results, f, indent=2, default=str)
+    if orjson is not None:
+        with open("prompt_validation_results.json", "wb") as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str))
+    else:
+        with open("prompt_validation_results.json", "w") as f:
+            json.dump(results, f, indent=2, default=str)
     
     print("\n📁 Results saved to prompt_validation_results.json")
     
@@ -6,15 +6,27 @@ Advanced automated quality scoring algorithms for comprehensive assessment of
 BOS methodology prompt responses across multiple dimensions and quality criteria.
 """
 
+import copy
 import json
 import re
 import math
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter
 from typing import Dict, List, Any, Tuple, Optional
 from dataclasses import dataclass, asdict
 from enum import Enum
+from operator import attrgetter
+from pathlib import Path
+from types import MappingProxyType
 import nltk
 from textstat import flesch_reading_ease, flesch_kincaid_grade
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 
 class QualityDimension(Enum):
     COMPLETENESS = "completeness"
@@ -27,7 +39,7 @@ class QualityDimension(Enum):
     BUSINESS_VALUE = "business_value"
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityScore:
     """Comprehensive quality score with detailed breakdown."""
     overall_score: float
@@ -40,9 +52,13 @@ class QualityScore:
     strengths: List[str]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScoringWeights:
-    """Configurable weights for different quality dimensions."""
+    """Configurable weights for different quality dimensions.
+    
+    Frozen, so an engine's weights change only by assigning new ones (e.g. via
+    dataclasses.replace), which lets the engine refresh its weight vector and memo.
+    """
     completeness: float = 0.20
     specificity: float = 0.15
     measurability: float = 0.15
@@ -53,170 +69,451 @@ class ScoringWeights:
     business_value: float = 0.05
 
 
+@dataclass(slots=True)
+class ResponseFeatures:
+    """Per-response measurements shared by all dimension scorers, computed once."""
+    text: str
+    lower: str
+    word_count: int
+    sentence_count: int
+    question_count: int
+    term_counts: Counter
+
+
+# Dimension names in QualityDimension order, and a reader for their weights in that order
+_DIMENSION_NAMES = tuple(dimension.value for dimension in QualityDimension)
+_DIMENSION_WEIGHTS = attrgetter(*_DIMENSION_NAMES)
+
+WORD_TOKEN_PATTERN = re.compile(r'\w+')
+
+# Non-ASCII characters that re.IGNORECASE equates with an ASCII letter but str.lower()
+# does not ("İ".lower() is even two code points); folding them first keeps the lowercased
+# text aligned with the original and keyword counts equal to IGNORECASE matching
+_IGNORECASE_FOLDS = str.maketrans({"İ": "i", "ı": "i", "ſ": "s"})
+SENTENCE_END_PATTERN = re.compile(r'[.!?]')
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether char is a regex \\w character (alphanumeric or underscore)."""
+    return char.isalnum() or char == "_"
+
+
+class _KeywordMatcher:
+    """Whole-word counter for a lowercased keyword vocabulary over lowercased text.
+    
+    Per-keyword counts equal a separate \\bterm\\b findall per term, including keywords
+    nested in longer ones ("signal" inside "business signal"). Single-word keywords are
+    read from a token frequency table; phrases are located with str.find and kept only
+    where both ends fall on a word boundary.
+    """
+    
+    def __init__(self, terms: List[str]):
+        vocabulary = {term.lower() for term in terms}
+        # A \\w-only keyword matches \\bterm\\b exactly where it is a whole token
+        words = {term for term in vocabulary if WORD_TOKEN_PATTERN.fullmatch(term)}
+        # Per phrase: its first word, which is a whole token wherever the phrase matches, so
+        # phrases whose first word is absent from the token table are skipped without a scan
+        self._phrases = tuple(
+            (phrase, WORD_TOKEN_PATTERN.search(phrase).group(), _is_word_char(phrase[0]), _is_word_char(phrase[-1]))
+            for phrase in sorted(vocabulary - words)
+        )
+    
+    def term_counts(self, text_lower: str) -> Counter:
+        """Count occurrences of each keyword in already-lowercased text (single-word keywords via all token counts)."""
+        counts = Counter(WORD_TOKEN_PATTERN.findall(text_lower))
+        text_length = len(text_lower)
+        for phrase, first_word, word_start, word_end in self._phrases:
+            if first_word not in counts:
+                continue
+            found = 0
+            start = text_lower.find(phrase)
+            while start != -1:
+                end = start + len(phrase)
+                # \\b holds where the neighbouring character (non-word past either end of
+                # the text) differs in word-ness from the phrase edge
+                if ((start > 0 and _is_word_char(text_lower[start - 1])) != word_start and
+                        (end < text_length and _is_word_char(text_lower[end])) != word_end):
+                    found += 1
+                    start = text_lower.find(phrase, end)
+                else:
+                    start = text_lower.find(phrase, start + 1)
+            if found:
+                counts[phrase] += found
+        return counts
+
+
+def _compile_pattern(pattern: str, flags: int = 0):
+    """Compile with RE2's linear-time automaton when available, else the stdlib engine.
+    
+    RE2 has no lookaround, so patterns using it (the vague-language checks) stay on re.
+    Only re.IGNORECASE is carried over to RE2, as an inline flag.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile("(?i)" + pattern if flags & re.IGNORECASE else pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
+
+def _mean_std(values: List[float]) -> Tuple[float, float]:
+    """Mean and population standard deviation in one pass (Welford's algorithm)."""
+    if len(values) == 1:
+        return values[0], 0.0
+    mean = m2 = 0.0
+    for n, value in enumerate(values, 1):
+        delta = value - mean
+        mean += delta / n
+        m2 += delta * (value - mean)
+    return mean, math.sqrt(m2 / len(values))
+
+
+def _lower_terms(terms: List[str]) -> Tuple[str, ...]:
+    """Lowercase keywords for lookup in a _KeywordMatcher's term counts."""
+    return tuple(term.lower() for term in terms)
+
+
+def _count_terms(term_counts: Counter, terms: Tuple[str, ...]) -> int:
+    """Total occurrences of a keyword list in precomputed term counts."""
+    return sum(term_counts[term] for term in terms)
+
+
+# BOS methodology-specific keywords
+_BOS_KEYWORDS = {
+    "stakeholder_terms": [
+        "stakeholder", "customer", "user", "team", "department", 
+        "vendor", "supplier", "partner", "client", "end-user"
+    ],
+    "dependency_terms": [
+        "depends", "requires", "needs", "expects", "relies", 
+        "integration", "interface", "handoff", "upstream", "downstream"
+    ],
+    "impact_terms": [
+        "impact", "effect", "consequence", "result", "outcome",
+        "financial", "operational", "legal", "compliance", "customer experience"
+    ],
+    "telemetry_terms": [
+        "telemetry", "metrics", "monitoring", "observability", "instrumentation",
+        "logs", "traces", "events", "data", "measurement"
+    ],
+    "signal_terms": [
+        "signal", "indicator", "threshold", "alert", "trigger",
+        "business signal", "process signal", "system signal", "KPI"
+    ],
+    "methodology_terms": [
+        "WHO depends", "WHAT they expect", "WHAT breaks", "WHAT telemetry",
+        "WHAT signals", "playbook", "dashboard", "observable unit"
+    ]
+}
+
+# Patterns for quality assessment as (match type, pattern) pairs
+_QUALITY_PATTERNS = {
+    "measurable_patterns": [
+        ("percentages", r'\d+(?:\.\d+)?\s*%'),
+        ("time_units", r'\d+(?:\.\d+)?\s*(second|minute|hour|day|week|month)s?'),
+        ("currency", r'\$\d+(?:,\d{3})*(?:\.\d{2})?'),
+        ("technical_units", r'\d+(?:\.\d+)?\s*(ms|sec|min|hr|GB|MB|KB)'),
+        ("sla_references", r'SLA|availability|uptime.*?\d+'),
+        ("rate_units", r'\d+(?:\.\d+)?\s*(transaction|request|user)s?\s*per\s*(second|minute|hour)')
+    ],
+    "specific_patterns": [
+        ("precision_terms", r'\b(exactly|precisely|specifically|particular)\b'),
+        ("deadlines", r'\b(within|by|before|after)\s+\d+'),
+        ("obligations", r'\b(must|shall|will|required to)\b'),
+        ("system_components", r'\b(API|endpoint|service|database|table|queue|topic)\b')
+    ],
+    "actionable_patterns": [
+        ("creation_actions", r'\b(identify|define|create|implement|monitor|track|measure)\b'),
+        ("imperative_actions", r'\b(should|need to|must|will)\s+\w+'),
+        ("structured_actions", r'\b(step|action|task|requirement)s?\b'),
+        ("sequential_actions", r'\b(next|then|following|proceed)\b')
+    ],
+    "vague_patterns": [
+        ("vague_quantities", r'\b(some|many|several|various|numerous|multiple|different)\b'),
+        ("unquantified_qualities", r'\b(good|bad|better|worse|high|low|fast|slow)\b(?!\s+\d)'),
+        ("hedged_qualifiers", r'\b(appropriate|suitable|reasonable|adequate|sufficient)\b'),
+        ("unmeasured_improvements", r'\b(improve|enhance|optimize|better)\b(?!\s+\w+\s+by)')
+    ]
+}
+
+# Persona-specific vocabulary sets
+_PERSONA_VOCABULARIES = {
+    "product_owner": {
+        "appropriate": [
+            "business", "stakeholder", "requirement", "outcome", "value",
+            "customer", "user", "process", "workflow", "impact", "ROI",
+            "KPI", "metric", "goal", "objective", "success", "deliverable"
+        ],
+        "technical_ok": [
+            "system", "service", "application", "data", "report",
+            "dashboard", "integration", "interface", "platform"
+        ],
+        "avoid": [
+            "API", "database", "server", "code", "implementation",
+            "deployment", "infrastructure", "docker", "kubernetes"
+        ]
+    },
+    "developer": {
+        "appropriate": [
+            "API", "service", "endpoint", "database", "system", "code",
+            "implementation", "integration", "observable unit", "telemetry",
+            "instrumentation", "metrics", "logs", "traces", "monitoring"
+        ],
+        "business_ok": [
+            "business", "user", "customer", "process", "requirement",
+            "outcome", "stakeholder", "impact", "value"
+        ],
+        "avoid": [
+            "ROI", "business case", "strategy", "market", "competitive",
+            "revenue model", "customer acquisition"
+        ]
+    },
+    "platform_sre": {
+        "appropriate": [
+            "infrastructure", "platform", "monitoring", "alerting", "dashboard",
+            "system", "health", "performance", "reliability", "availability",
+            "SLA", "SLO", "uptime", "latency", "throughput", "capacity"
+        ],
+        "technical_ok": [
+            "service", "API", "database", "metrics", "logs", "traces",
+            "deployment", "scaling", "load balancing", "failover"
+        ],
+        "avoid": [
+            "business strategy", "market analysis", "customer acquisition",
+            "revenue optimization", "competitive advantage"
+        ]
+    }
+}
+
+# BOS methodology compliance indicators
+_METHODOLOGY_INDICATORS = {
+    "framework_references": [
+        "WHO depends", "WHAT they expect", "WHAT breaks",
+        "WHAT telemetry", "WHAT signals", "playbook", "dashboard"
+    ],
+    "session_commands": [
+        "/start", "/persona", "/step", "/validate", "/generate", "/status"
+    ],
+    "step_progression": [
+        "Step 1", "Step 2", "Step 3", "Step 4", "Step 5", "Step 6", "Step 7",
+        "next step", "proceed to", "complete", "continue"
+    ],
+    "validation_elements": [
+        "validate", "check", "review", "assess", "evaluate", "score"
+    ]
+}
+
+# Business value orientation indicators
+_BUSINESS_VALUE_INDICATORS = [
+    "business", "value", "outcome", "result", "benefit", "impact",
+    "ROI", "cost", "revenue", "efficiency", "productivity", "quality",
+    "customer", "user", "stakeholder", "satisfaction", "experience"
+]
+
+# Patterns compiled once at import from their original sources
+_COMPILED_QUALITY_PATTERNS = MappingProxyType({
+    category: tuple(_compile_pattern(pattern, re.IGNORECASE) for _, pattern in patterns)
+    for category, patterns in _QUALITY_PATTERNS.items()
+})
+# Measurable and actionable matches are tallied per named pattern; each pattern is scanned
+# on its own so overlapping matches of different patterns all count
+_MEASURABLE_PATTERNS = tuple(zip(
+    (name for name, _ in _QUALITY_PATTERNS["measurable_patterns"]),
+    _COMPILED_QUALITY_PATTERNS["measurable_patterns"]
+))
+_ACTIONABLE_PATTERNS = tuple(zip(
+    (name for name, _ in _QUALITY_PATTERNS["actionable_patterns"]),
+    _COMPILED_QUALITY_PATTERNS["actionable_patterns"]
+))
+_INDICATOR_PATTERNS = tuple(
+    pattern for patterns in _COMPILED_QUALITY_PATTERNS.values() for pattern in patterns
+)
+
+# Read-only lowercase keyword lists, counted from a single sweep over the response
+_BOS_TERMS = MappingProxyType({
+    category: _lower_terms(terms) for category, terms in _BOS_KEYWORDS.items()
+})
+_PERSONA_TERMS = MappingProxyType({
+    persona: MappingProxyType({
+        "appropriate": _lower_terms(vocab["appropriate"]),
+        "context_ok": _lower_terms(vocab.get("business_ok", []) + vocab.get("technical_ok", [])),
+        "avoid": _lower_terms(vocab["avoid"])
+    })
+    for persona, vocab in _PERSONA_VOCABULARIES.items()
+})
+_METHODOLOGY_TERMS = MappingProxyType({
+    category: _lower_terms(indicators) for category, indicators in _METHODOLOGY_INDICATORS.items()
+})
+_BUSINESS_VALUE_TERMS = _lower_terms(_BUSINESS_VALUE_INDICATORS)
+_KEYWORD_MATCHER = _KeywordMatcher(
+    [term for terms in _BOS_TERMS.values() for term in terms] +
+    [term for vocab in _PERSONA_TERMS.values() for terms in vocab.values() for term in terms] +
+    [term for terms in _METHODOLOGY_TERMS.values() for term in terms] +
+    list(_BUSINESS_VALUE_TERMS)
+)
+
+# Improvement messages as (dimension, message) pairs in QualityDimension order
+_IMPROVEMENT_MESSAGES = (
+    ("completeness", "Enhance BOS methodology coverage completeness"),
+    ("specificity", "Increase specificity and reduce vague language"),
+    ("measurability", "Add more quantified metrics and measurable outcomes"),
+    ("actionability", "Provide clearer actionable guidance and next steps"),
+    ("consistency", "Improve terminology and structural consistency"),
+    ("persona_appropriateness", "Better align language and focus with persona needs"),
+    ("methodology_compliance", "Strengthen adherence to BOS methodology framework"),
+    ("business_value", "Emphasize business value and stakeholder outcomes")
+)
+
+# Strength messages as (dimension, message) pairs in QualityDimension order, so the
+# threshold sweep walks a fixed tuple with one score lookup per dimension
+_STRENGTH_MESSAGES = (
+    ("completeness", "Excellent BOS methodology coverage"),
+    ("specificity", "High specificity and clear language"),
+    ("measurability", "Strong quantified metrics and measurable outcomes"),
+    ("actionability", "Clear actionable guidance provided"),
+    ("consistency", "Consistent terminology and structure"),
+    ("persona_appropriateness", "Well-aligned with persona needs and expertise"),
+    ("methodology_compliance", "Strong BOS methodology framework adherence"),
+    ("business_value", "Clear business value orientation")
+)
+
+
 class QualityScoringEngine:
     """Advanced quality scoring engine for BOS methodology responses."""
     
+    # Completeness elements: (element, BOS keyword category, target count, weight)
+    _COMPLETENESS_ELEMENTS = (
+        ("stakeholder_identification", "stakeholder_terms", 3.0, 0.25),
+        ("dependency_mapping", "dependency_terms", 2.0, 0.20),
+        ("impact_analysis", "impact_terms", 3.0, 0.20),
+        ("telemetry_coverage", "telemetry_terms", 2.0, 0.15),
+        ("signal_definition", "signal_terms", 2.0, 0.20)
+    )
+    
     def __init__(self, scoring_weights: Optional[ScoringWeights] = None):
+        # Per-engine memo of context-free scores, since results depend on this engine's weights
+        self._score_core = functools.lru_cache(maxsize=4096)(self._score_response)
         self.weights = scoring_weights or ScoringWeights()
-        self.bos_keywords = self._initialize_bos_keywords()
-        self.quality_patterns = self._initialize_quality_patterns()
-        self.persona_vocabularies = self._initialize_persona_vocabularies()
+        # Vocabularies, patterns and the keyword matcher are built once at import and shared
+        self.bos_keywords = _BOS_KEYWORDS
+        self.quality_patterns = _QUALITY_PATTERNS
+        self.persona_vocabularies = _PERSONA_VOCABULARIES
+        self.methodology_indicators = _METHODOLOGY_INDICATORS
+        self.business_value_indicators = _BUSINESS_VALUE_INDICATORS
+        self.compiled_quality_patterns = _COMPILED_QUALITY_PATTERNS
+        self.measurable_patterns = _MEASURABLE_PATTERNS
+        self.actionable_patterns = _ACTIONABLE_PATTERNS
+        self._indicator_patterns = _INDICATOR_PATTERNS
+        self.bos_terms = _BOS_TERMS
+        self.persona_terms = _PERSONA_TERMS
+        self.methodology_terms = _METHODOLOGY_TERMS
+        self.business_value_terms = _BUSINESS_VALUE_TERMS
+        self.keyword_matcher = _KEYWORD_MATCHER
+    
+    @property
+    def weights(self) -> ScoringWeights:
+        """Scoring weights; assigning new weights discards scores memoized under the old ones."""
+        return self._weights
+    
+    @weights.setter
+    def weights(self, weights: ScoringWeights) -> None:
+        self._weights = weights
+        # (dimension, weight) pairs in QualityDimension order for the weighted sum
+        self._dimension_weights = tuple(zip(_DIMENSION_NAMES, _DIMENSION_WEIGHTS(weights)))
+        self._score_core.cache_clear()
         
-    def _initialize_bos_keywords(self) -> Dict[str, List[str]]:
-        """Initialize BOS methodology-specific keywords."""
-        return {
-            "stakeholder_terms": [
-                "stakeholder", "customer", "user", "team", "department", 
-                "vendor", "supplier", "partner", "client", "end-user"
-            ],
-            "dependency_terms": [
-                "depends", "requires", "needs", "expects", "relies", 
-                "integration", "interface", "handoff", "upstream", "downstream"
-            ],
-            "impact_terms": [
-                "impact", "effect", "consequence", "result", "outcome",
-                "financial", "operational", "legal", "compliance", "customer experience"
-            ],
-            "telemetry_terms": [
-                "telemetry", "metrics", "monitoring", "observability", "instrumentation",
-                "logs", "traces", "events", "data", "measurement"
-            ],
-            "signal_terms": [
-                "signal", "indicator", "threshold", "alert", "trigger",
-                "business signal", "process signal", "system signal", "KPI"
-            ],
-            "methodology_terms": [
-                "WHO depends", "WHAT they expect", "WHAT breaks", "WHAT telemetry",
-                "WHAT signals", "playbook", "dashboard", "observable unit"
-            ]
-        }
+    def calculate_quality_score(self, response: str, persona: str, 
+                              scenario_context: Optional[Dict] = None, *,
+                              detail: bool = True) -> QualityScore:
+        """Calculate comprehensive quality score for a response.
+        
+        Scores without scenario context are memoized on (response, persona, detail); each call
+        returns its own copy of the memoized QualityScore. With
+        detail=False, detailed_analysis holds only each dimension's score, for callers that
+        read just the overall results.
+        """
+        if scenario_context is None:
+            return copy.deepcopy(self._score_core(response, persona, None, detail))
+        return self._score_response(response, persona, scenario_context, detail)
     
-    def _initialize_quality_patterns(self) -> Dict[str, List[str]]:
-        """Initialize patterns for quality assessment."""
-        return {
-            "measurable_patterns": [
-                r'\d+(?:\.\d+)?\s*%',  # Percentages
-                r'\d+(?:\.\d+)?\s*(second|minute|hour|day|week|month)s?',  # Time units
-                r'\$\d+(?:,\d{3})*(?:\.\d{2})?',  # Currency
-                r'\d+(?:\.\d+)?\s*(ms|sec|min|hr|GB|MB|KB)',  # Technical units
-                r'SLA|availability|uptime.*?\d+',  # SLA references
-                r'\d+(?:\.\d+)?\s*(transaction|request|user)s?\s*per\s*(second|minute|hour)'  # Rate units
-            ],
-            "specific_patterns": [
-                r'\b(exactly|precisely|specifically|particular)\b',
-                r'\b(within|by|before|after)\s+\d+',
-                r'\b(must|shall|will|required to)\b',
-                r'\b(API|endpoint|service|database|table|queue|topic)\b'
-            ],
-            "actionable_patterns": [
-                r'\b(identify|define|create|implement|monitor|track|measure)\b',
-                r'\b(should|need to|must|will)\s+\w+',
-                r'\b(step|action|task|requirement)s?\b',
-                r'\b(next|then|following|proceed)\b'
-            ],
-            "vague_patterns": [
-                r'\b(some|many|several|various|numerous|multiple|different)\b',
-                r'\b(good|bad|better|worse|high|low|fast|slow)\b(?!\s+\d)',
-                r'\b(appropriate|suitable|reasonable|adequate|sufficient)\b',
-                r'\b(improve|enhance|optimize|better)\b(?!\s+\w+\s+by)'
-            ]
-        }
+    def calculate_quality_scores_batch(self, responses: List[str], personas: List[str],
+                                       max_workers: int = 1, *, detail: bool = False) -> List[QualityScore]:
+        """Score a batch of responses, one persona per response.
+        
+        Repeated (response, persona) pairs are scored once. With max_workers > 1 the distinct
+        pairs are scored in that many worker processes, since responses are independent;
+        otherwise they are scored in-process through the memo cache. Per-dimension breakdowns
+        are skipped unless detail=True, as batch callers typically read only the overall scores.
+        """
+        if len(responses) != len(personas):
+            raise ValueError(f"Got {len(responses)} responses but {len(personas)} personas")
+        
+        pairs = list(zip(responses, personas))
+        if max_workers <= 1 or len(pairs) < 2:
+            return [copy.deepcopy(self._score_core(response, persona, None, detail))
+                    for response, persona in pairs]
+        
+        unique_pairs = list(dict.fromkeys(pairs))
+        chunksize = max(1, len(unique_pairs) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_batch_worker,
+                                 initargs=(self.weights,)) as executor:
+            score_pair = functools.partial(_score_in_batch_worker, detail=detail)
+            scores = dict(zip(unique_pairs, executor.map(score_pair, unique_pairs, chunksize=chunksize)))
+        # Repeated pairs share one scored result, so each position gets its own copy
+        return [copy.deepcopy(scores[pair]) for pair in pairs]
     
-    def _initialize_persona_vocabularies(self) -> Dict[str, Dict[str, List[str]]]:
-        """Initialize persona-specific vocabulary sets."""
-        return {
-            "product_owner": {
-                "appropriate": [
-                    "business", "stakeholder", "requirement", "outcome", "value",
-                    "customer", "user", "process", "workflow", "impact", "ROI",
-                    "KPI", "metric", "goal", "objective", "success", "deliverable"
-                ],
-                "technical_ok": [
-                    "system", "service", "application", "data", "report",
-                    "dashboard", "integration", "interface", "platform"
-                ],
-                "avoid": [
-                    "API", "database", "server", "code", "implementation",
-                    "deployment", "infrastructure", "docker", "kubernetes"
-                ]
-            },
-            "developer": {
-                "appropriate": [
-                    "API", "service", "endpoint", "database", "system", "code",
-                    "implementation", "integration", "observable unit", "telemetry",
-                    "instrumentation", "metrics", "logs", "traces", "monitoring"
-                ],
-                "business_ok": [
-                    "business", "user", "customer", "process", "requirement",
-                    "outcome", "stakeholder", "impact", "value"
-                ],
-                "avoid": [
-                    "ROI", "business case", "strategy", "market", "competitive",
-                    "revenue model", "customer acquisition"
-                ]
-            },
-            "platform_sre": {
-                "appropriate": [
-                    "infrastructure", "platform", "monitoring", "alerting", "dashboard",
-                    "system", "health", "performance", "reliability", "availability",
-                    "SLA", "SLO", "uptime", "latency", "throughput", "capacity"
-                ],
-                "technical_ok": [
-                    "service", "API", "database", "metrics", "logs", "traces",
-                    "deployment", "scaling", "load balancing", "failover"
-                ],
-                "avoid": [
-                    "business strategy", "market analysis", "customer acquisition",
-                    "revenue optimization", "competitive advantage"
-                ]
-            }
-        }
+    def clear_cache(self) -> None:
+        """Discard memoized scores, e.g. between test runs."""
+        self._score_core.cache_clear()
     
-    def calculate_quality_score(self, response: str, persona: str, 
-                              scenario_context: Optional[Dict] = None) -> QualityScore:
-        """Calculate comprehensive quality score for a response."""
+    def _score_response(self, response: str, persona: str,
+                        scenario_context: Optional[Dict] = None, detail: bool = True) -> QualityScore:
+        """Score a response across all quality dimensions."""
         
         # Calculate dimension scores
         dimension_scores = {}
         detailed_analysis = {}
         
+        # Measure the response once; every scorer reads from these features
+        features = self._extract_features(response)
+        
         # 1. Completeness Score
-        completeness_result = self._calculate_completeness_score(response, scenario_context)
+        completeness_result = self._calculate_completeness_score(features, scenario_context, detail)
         dimension_scores[QualityDimension.COMPLETENESS.value] = completeness_result["score"]
         detailed_analysis["completeness"] = completeness_result
         
         # 2. Specificity Score
-        specificity_result = self._calculate_specificity_score(response)
+        specificity_result = self._calculate_specificity_score(features, detail)
         dimension_scores[QualityDimension.SPECIFICITY.value] = specificity_result["score"]
         detailed_analysis["specificity"] = specificity_result
         
         # 3. Measurability Score
-        measurability_result = self._calculate_measurability_score(response)
+        measurability_result = self._calculate_measurability_score(features, detail)
         dimension_scores[QualityDimension.MEASURABILITY.value] = measurability_result["score"]
         detailed_analysis["measurability"] = measurability_result
         
         # 4. Actionability Score
-        actionability_result = self._calculate_actionability_score(response)
+        actionability_result = self._calculate_actionability_score(features, detail)
         dimension_scores[QualityDimension.ACTIONABILITY.value] = actionability_result["score"]
         detailed_analysis["actionability"] = actionability_result
         
         # 5. Consistency Score
-        consistency_result = self._calculate_consistency_score(response)
+        consistency_result = self._calculate_consistency_score(features, detail)
         dimension_scores[QualityDimension.CONSISTENCY.value] = consistency_result["score"]
         detailed_analysis["consistency"] = consistency_result
         
         # 6. Persona Appropriateness Score
-        persona_result = self._calculate_persona_appropriateness_score(response, persona)
+        persona_result = self._calculate_persona_appropriateness_score(features, persona, detail)
         dimension_scores[QualityDimension.PERSONA_APPROPRIATENESS.value] = persona_result["score"]
         detailed_analysis["persona_appropriateness"] = persona_result
         
         # 7. Methodology Compliance Score
-        methodology_result = self._calculate_methodology_compliance_score(response)
+        methodology_result = self._calculate_methodology_compliance_score(features, detail)
         dimension_scores[QualityDimension.METHODOLOGY_COMPLIANCE.value] = methodology_result["score"]
         detailed_analysis["methodology_compliance"] = methodology_result
         
         # 8. Business Value Score
-        business_value_result = self._calculate_business_value_score(response, persona)
+        business_value_result = self._calculate_business_value_score(features, persona, detail)
         dimension_scores[QualityDimension.BUSINESS_VALUE.value] = business_value_result["score"]
         detailed_analysis["business_value"] = business_value_result
         
@@ -224,12 +521,11 @@ class QualityScoringEngine:
         overall_score = sum(dimension_scores.values()) / len(dimension_scores)
         
         weighted_score = sum(
-            dimension_scores[dim.value] * getattr(self.weights, dim.value)
-            for dim in QualityDimension
+            dimension_scores[dimension] * weight for dimension, weight in self._dimension_weights
         )
         
         # Calculate confidence level
-        confidence_level = self._calculate_confidence_level(dimension_scores, response)
+        confidence_level = self._calculate_confidence_level(dimension_scores, features)
         
         # Determine quality grade
         quality_grade = self._determine_quality_grade(weighted_score)
@@ -249,59 +545,37 @@ class QualityScoringEngine:
             strengths=strengths
         )
     
-    def _calculate_completeness_score(self, response: str, context: Optional[Dict]) -> Dict[str, Any]:
+    def _extract_features(self, response: str) -> ResponseFeatures:
+        """Measure word, sentence and keyword counts for a response in one place."""
+        response_lower = response.translate(_IGNORECASE_FOLDS).lower()
+        return ResponseFeatures(
+            text=response,
+            lower=response_lower,
+            word_count=len(response.split()),
+            sentence_count=len(SENTENCE_END_PATTERN.findall(response)),
+            question_count=response.count("?"),
+            # Count every keyword in one pass; keyword-based scorers read from these counts
+            term_counts=self.keyword_matcher.term_counts(response_lower)
+        )
+    
+    def _calculate_completeness_score(self, features: ResponseFeatures, context: Optional[Dict], detail: bool = True) -> Dict[str, Any]:
         """Calculate completeness score based on BOS methodology coverage."""
-        required_elements = {
-            "stakeholder_identification": 0.25,
-            "dependency_mapping": 0.20,
-            "impact_analysis": 0.20,
-            "telemetry_coverage": 0.15,
-            "signal_definition": 0.20
+        term_counts = features.term_counts
+        # Each element's keyword count is capped against its target, then weighted
+        element_scores = {
+            element: min(_count_terms(term_counts, self.bos_terms[category]) / target, 1.0)
+            for element, category, target, _ in self._COMPLETENESS_ELEMENTS
         }
         
-        element_scores = {}
-        
-        # Check stakeholder identification
-        stakeholder_count = sum(
-            len(re.findall(rf'\b{term}\b', response, re.IGNORECASE))
-            for term in self.bos_keywords["stakeholder_terms"]
-        )
-        element_scores["stakeholder_identification"] = min(stakeholder_count / 3.0, 1.0)
-        
-        # Check dependency mapping
-        dependency_count = sum(
-            len(re.findall(rf'\b{term}\b', response, re.IGNORECASE))
-            for term in self.bos_keywords["dependency_terms"]
-        )
-        element_scores["dependency_mapping"] = min(dependency_count / 2.0, 1.0)
-        
-        # Check impact analysis
-        impact_count = sum(
-            len(re.findall(rf'\b{term}\b', response, re.IGNORECASE))
-            for term in self.bos_keywords["impact_terms"]
-        )
-        element_scores["impact_analysis"] = min(impact_count / 3.0, 1.0)
-        
-        # Check telemetry coverage
-        telemetry_count = sum(
-            len(re.findall(rf'\b{term}\b', response, re.IGNORECASE))
-            for term in self.bos_keywords["telemetry_terms"]
-        )
-        element_scores["telemetry_coverage"] = min(telemetry_count / 2.0, 1.0)
-        
-        # Check signal definition
-        signal_count = sum(
-            len(re.findall(rf'\b{term}\b', response, re.IGNORECASE))
-            for term in self.bos_keywords["signal_terms"]
-        )
-        element_scores["signal_definition"] = min(signal_count / 2.0, 1.0)
-        
         # Calculate weighted completeness score
         completeness_score = sum(
             element_scores[element] * weight
-            for element, weight in required_elements.items()
+            for element, _, _, weight in self._COMPLETENESS_ELEMENTS
         )
         
+        if not detail:
+            return {"score": completeness_score}
+        
         return {
             "score": completeness_score,
             "element_scores": element_scores,
@@ -311,21 +585,21 @@ class QualityScoringEngine:
             ]
         }
     
-    def _calculate_specificity_score(self, response: str) -> Dict[str, Any]:
+    def _calculate_specificity_score(self, features: ResponseFeatures, detail: bool = True) -> Dict[str, Any]:
         """Calculate specificity score based on concrete vs. vague language."""
         
         # Count specific indicators
         specific_count = 0
-        for pattern in self.quality_patterns["specific_patterns"]:
-            specific_count += len(re.findall(pattern, response, re.IGNORECASE))
+        for pattern in self.compiled_quality_patterns["specific_patterns"]:
+            specific_count += len(pattern.findall(features.text))
         
         # Count vague indicators (penalty)
         vague_count = 0
-        for pattern in self.quality_patterns["vague_patterns"]:
-            vague_count += len(re.findall(pattern, response, re.IGNORECASE))
+        for pattern in self.compiled_quality_patterns["vague_patterns"]:
+            vague_count += len(pattern.findall(features.text))
         
-        # Calculate word count for normalization
-        word_count = len(response.split())
+        # Word count for normalization
+        word_count = features.word_count
         
         if word_count == 0:
             return {"score": 0.0, "specific_count": 0, "vague_count": 0}
@@ -337,6 +611,9 @@ class QualityScoringEngine:
         # Calculate specificity score (specific terms boost, vague terms penalize)
         specificity_score = min(max(specific_ratio - vague_ratio * 0.5, 0), 1.0)
         
+        if not detail:
+            return {"score": specificity_score}
+        
         return {
             "score": specificity_score,
             "specific_count": specific_count,
@@ -345,28 +622,17 @@ class QualityScoringEngine:
             "vague_ratio": vague_ratio
         }
     
-    def _calculate_measurability_score(self, response: str) -> Dict[str, Any]:
+    def _calculate_measurability_score(self, features: ResponseFeatures, detail: bool = True) -> Dict[str, Any]:
         """Calculate measurability score based on quantified metrics."""
         
-        measurable_count = 0
-        measurable_types = {}
-        
-        for pattern in self.quality_patterns["measurable_patterns"]:
-            matches = re.findall(pattern, response, re.IGNORECASE)
-            measurable_count += len(matches)
-            
-            # Categorize measurable types
-            if "%" in pattern:
-                measurable_types["percentages"] = len(matches)
-            elif "second|minute|hour" in pattern:
-                measurable_types["time_units"] = len(matches)
-            elif "\\$" in pattern:
-                measurable_types["currency"] = len(matches)
-            elif "ms|sec|min" in pattern:
-                measurable_types["technical_units"] = len(matches)
+        # Categorize measurable types by the pattern that matched
+        measurable_types = {
+            name: len(pattern.findall(features.text)) for name, pattern in self.measurable_patterns
+        }
+        measurable_count = sum(measurable_types.values())
         
         # Normalize by response length
-        word_count = len(response.split())
+        word_count = features.word_count
         if word_count == 0:
             return {"score": 0.0, "measurable_count": 0}
         
@@ -374,6 +640,9 @@ class QualityScoringEngine:
         target_ratio = word_count / 50
         measurability_score = min(measurable_count / max(target_ratio, 1), 1.0)
         
+        if not detail:
+            return {"score": measurability_score}
+        
         return {
             "score": measurability_score,
             "measurable_count": measurable_count,
@@ -381,30 +650,19 @@ class QualityScoringEngine:
             "target_ratio": target_ratio
         }
     
-    def _calculate_actionability_score(self, response: str) -> Dict[str, Any]:
+    def _calculate_actionability_score(self, features: ResponseFeatures, detail: bool = True) -> Dict[str, Any]:
         """Calculate actionability score based on clear actions and instructions."""
         
-        actionable_count = 0
-        action_types = {}
-        
-        for pattern in self.quality_patterns["actionable_patterns"]:
-            matches = re.findall(pattern, response, re.IGNORECASE)
-            actionable_count += len(matches)
-            
-            if "identify|define|create" in pattern:
-                action_types["creation_actions"] = len(matches)
-            elif "should|need|must" in pattern:
-                action_types["imperative_actions"] = len(matches)
-            elif "step|action|task" in pattern:
-                action_types["structured_actions"] = len(matches)
-            elif "next|then|following" in pattern:
-                action_types["sequential_actions"] = len(matches)
+        action_types = {
+            name: len(pattern.findall(features.text)) for name, pattern in self.actionable_patterns
+        }
+        actionable_count = sum(action_types.values())
         
         # Check for questions that guide action
-        question_count = len(re.findall(r'\?', response))
+        question_count = features.question_count
         
         # Normalize by sentence count
-        sentence_count = len(re.findall(r'[.!?]', response))
+        sentence_count = features.sentence_count
         if sentence_count == 0:
             return {"score": 0.0, "actionable_count": 0}
         
@@ -412,6 +670,9 @@ class QualityScoringEngine:
         target_ratio = sentence_count / 2
         actionability_score = min((actionable_count + question_count) / max(target_ratio, 1), 1.0)
         
+        if not detail:
+            return {"score": actionability_score}
+        
         return {
             "score": actionability_score,
             "actionable_count": actionable_count,
@@ -419,25 +680,28 @@ class QualityScoringEngine:
             "question_count": question_count
         }
     
-    def _calculate_consistency_score(self, response: str) -> Dict[str, Any]:
+    def _calculate_consistency_score(self, features: ResponseFeatures, detail: bool = True) -> Dict[str, Any]:
         """Calculate consistency score based on terminology and structure."""
+        term_counts = features.term_counts
         
         # Check for consistent terminology usage
         term_consistency = {}
         
         # Check BOS methodology term consistency
-        for category, terms in self.bos_keywords.items():
+        for category, terms in self.bos_terms.items():
             category_mentions = []
             for term in terms:
-                mentions = len(re.findall(rf'\b{term}\b', response, re.IGNORECASE))
+                mentions = term_counts[term]
                 if mentions > 0:
                     category_mentions.append(mentions)
             
-            if category_mentions:
+            mention_terms = len(category_mentions)
+            if mention_terms == 1:
+                # A single mentioned term has zero spread
+                term_consistency[category] = 1.0
+            elif mention_terms:
                 # Consistency measured as standard deviation of term usage
-                avg_mentions = sum(category_mentions) / len(category_mentions)
-                variance = sum((x - avg_mentions) ** 2 for x in category_mentions) / len(category_mentions)
-                std_dev = math.sqrt(variance)
+                avg_mentions, std_dev = _mean_std(category_mentions)
                 
                 # Normalize consistency (lower std_dev = higher consistency)
                 consistency = max(0, 1 - (std_dev / max(avg_mentions, 1)))
@@ -449,40 +713,35 @@ class QualityScoringEngine:
         else:
             consistency_score = 0.5  # Neutral score if no terms found
         
+        if not detail:
+            return {"score": consistency_score}
+        
         return {
             "score": consistency_score,
             "term_consistency": term_consistency
         }
     
-    def _calculate_persona_appropriateness_score(self, response: str, persona: str) -> Dict[str, Any]:
+    def _calculate_persona_appropriateness_score(self, features: ResponseFeatures, persona: str, detail: bool = True) -> Dict[str, Any]:
         """Calculate persona appropriateness score."""
         
         if persona not in self.persona_vocabularies:
             return {"score": 0.5, "message": "Unknown persona"}
         
-        vocab = self.persona_vocabularies[persona]
+        vocab = self.persona_terms[persona]
+        term_counts = features.term_counts
         
         # Count appropriate terms
-        appropriate_count = sum(
-            len(re.findall(rf'\b{term}\b', response, re.IGNORECASE))
-            for term in vocab["appropriate"]
-        )
+        appropriate_count = _count_terms(term_counts, vocab["appropriate"])
         
         # Count business/technical terms (context-dependent appropriateness)
-        context_ok_count = sum(
-            len(re.findall(rf'\b{term}\b', response, re.IGNORECASE))
-            for term in vocab.get("business_ok", []) + vocab.get("technical_ok", [])
-        )
+        context_ok_count = _count_terms(term_counts, vocab["context_ok"])
         
         # Count inappropriate terms (penalty)
-        inappropriate_count = sum(
-            len(re.findall(rf'\b{term}\b', response, re.IGNORECASE))
-            for term in vocab["avoid"]
-        )
+        inappropriate_count = _count_terms(term_counts, vocab["avoid"])
         
         # Calculate appropriateness score
         total_appropriate = appropriate_count + (context_ok_count * 0.5)
-        total_words = len(response.split())
+        total_words = features.word_count
         
         if total_words == 0:
             return {"score": 0.0}
@@ -493,6 +752,9 @@ class QualityScoringEngine:
         
         persona_score = max(min(appropriateness_ratio - inappropriateness_penalty, 1.0), 0.0)
         
+        if not detail:
+            return {"score": persona_score}
+        
         return {
             "score": persona_score,
             "appropriate_count": appropriate_count,
@@ -501,33 +763,13 @@ class QualityScoringEngine:
             "appropriateness_ratio": appropriateness_ratio
         }
     
-    def _calculate_methodology_compliance_score(self, response: str) -> Dict[str, Any]:
+    def _calculate_methodology_compliance_score(self, features: ResponseFeatures, detail: bool = True) -> Dict[str, Any]:
         """Calculate BOS methodology compliance score."""
         
-        methodology_indicators = {
-            "framework_references": [
-                "WHO depends", "WHAT they expect", "WHAT breaks",
-                "WHAT telemetry", "WHAT signals", "playbook", "dashboard"
-            ],
-            "session_commands": [
-                "/start", "/persona", "/step", "/validate", "/generate", "/status"
-            ],
-            "step_progression": [
-                "Step 1", "Step 2", "Step 3", "Step 4", "Step 5", "Step 6", "Step 7",
-                "next step", "proceed to", "complete", "continue"
-            ],
-            "validation_elements": [
-                "validate", "check", "review", "assess", "evaluate", "score"
-            ]
-        }
-        
         compliance_scores = {}
         
-        for category, indicators in methodology_indicators.items():
-            found_count = sum(
-                len(re.findall(rf'\b{re.escape(indicator)}\b', response, re.IGNORECASE))
-                for indicator in indicators
-            )
+        for category, indicators in self.methodology_terms.items():
+            found_count = _count_terms(features.term_counts, indicators)
             
             # Normalize by category expectations
             if category == "framework_references":
@@ -544,24 +786,18 @@ class QualityScoringEngine:
         # Overall methodology compliance
         methodology_score = sum(compliance_scores.values()) / len(compliance_scores)
         
+        if not detail:
+            return {"score": methodology_score}
+        
         return {
             "score": methodology_score,
             "compliance_scores": compliance_scores
         }
     
-    def _calculate_business_value_score(self, response: str, persona: str) -> Dict[str, Any]:
+    def _calculate_business_value_score(self, features: ResponseFeatures, persona: str, detail: bool = True) -> Dict[str, Any]:
         """Calculate business value orientation score."""
         
-        business_value_indicators = [
-            "business", "value", "outcome", "result", "benefit", "impact",
-            "ROI", "cost", "revenue", "efficiency", "productivity", "quality",
-            "customer", "user", "stakeholder", "satisfaction", "experience"
-        ]
-        
-        value_count = sum(
-            len(re.findall(rf'\b{term}\b', response, re.IGNORECASE))
-            for term in business_value_indicators
-        )
+        value_count = _count_terms(features.term_counts, self.business_value_terms)
         
         # Adjust expectations based on persona
         if persona == "product_owner":
@@ -573,13 +809,16 @@ class QualityScoringEngine:
         else:
             target_ratio = 0.5  # Default expectation
         
-        word_count = len(response.split())
+        word_count = features.word_count
         if word_count == 0:
             return {"score": 0.0}
         
         value_ratio = value_count / (word_count / 20)  # Per 20 words
         business_value_score = min(value_ratio / target_ratio, 1.0)
         
+        if not detail:
+            return {"score": business_value_score}
+        
         return {
             "score": business_value_score,
             "value_count": value_count,
@@ -587,7 +826,7 @@ class QualityScoringEngine:
             "value_ratio": value_ratio
         }
     
-    def _calculate_confidence_level(self, dimension_scores: Dict[str, float], response: str) -> float:
+    def _calculate_confidence_level(self, dimension_scores: Dict[str, float], features: ResponseFeatures) -> float:
         """Calculate confidence level in the quality assessment."""
         
         # Factors affecting confidence:
@@ -595,26 +834,24 @@ class QualityScoringEngine:
         # 2. Score variance (consistent scores across dimensions = higher confidence)
         # 3. Clear indicators (responses with clear patterns = higher confidence)
         
-        response_length = len(response.split())
+        response_length = features.word_count
         length_factor = min(response_length / 100, 1.0)  # Normalize to 100 words
         
         # Calculate score variance
         scores = list(dimension_scores.values())
         if len(scores) > 1:
-            mean_score = sum(scores) / len(scores)
-            variance = sum((score - mean_score) ** 2 for score in scores) / len(scores)
+            variance = _mean_std(scores)[1] ** 2
             consistency_factor = max(0, 1 - variance)
         else:
             consistency_factor = 0.5
         
-        # Clear indicators factor (presence of specific patterns)
+        # Clear indicators factor (presence of specific patterns); the factor saturates at
+        # 10 indicators, so the remaining patterns need not be scanned once that is reached
         indicator_count = 0
-        all_patterns = []
-        for pattern_list in self.quality_patterns.values():
-            all_patterns.extend(pattern_list)
-        
-        for pattern in all_patterns:
-            indicator_count += len(re.findall(pattern, response, re.IGNORECASE))
+        for pattern in self._indicator_patterns:
+            indicator_count += len(pattern.findall(features.text))
+            if indicator_count >= 10:
+                break
         
         indicator_factor = min(indicator_count / 10, 1.0)  # Normalize to 10 indicators
         
@@ -650,57 +887,34 @@ class QualityScoringEngine:
     
     def _identify_improvement_areas(self, dimension_scores: Dict[str, float]) -> List[str]:
         """Identify areas needing improvement based on low scores."""
-        improvement_areas = []
-        
         threshold = 0.7  # Scores below this need improvement
         
-        for dimension, score in dimension_scores.items():
-            if score < threshold:
-                if dimension == "completeness":
-                    improvement_areas.append("Enhance BOS methodology coverage completeness")
-                elif dimension == "specificity":
-                    improvement_areas.append("Increase specificity and reduce vague language")
-                elif dimension == "measurability":
-                    improvement_areas.append("Add more quantified metrics and measurable outcomes")
-                elif dimension == "actionability":
-                    improvement_areas.append("Provide clearer actionable guidance and next steps")
-                elif dimension == "consistency":
-                    improvement_areas.append("Improve terminology and structural consistency")
-                elif dimension == "persona_appropriateness":
-                    improvement_areas.append("Better align language and focus with persona needs")
-                elif dimension == "methodology_compliance":
-                    improvement_areas.append("Strengthen adherence to BOS methodology framework")
-                elif dimension == "business_value":
-                    improvement_areas.append("Emphasize business value and stakeholder outcomes")
-        
-        return improvement_areas
+        # Dimensions missing from the scores default to the threshold and are not reported
+        return [message for dimension, message in _IMPROVEMENT_MESSAGES
+                if dimension_scores.get(dimension, threshold) < threshold]
     
     def _identify_strengths(self, dimension_scores: Dict[str, float]) -> List[str]:
         """Identify strength areas based on high scores."""
-        strengths = []
-        
         threshold = 0.85  # Scores above this are strengths
         
-        for dimension, score in dimension_scores.items():
-            if score >= threshold:
-                if dimension == "completeness":
-                    strengths.append("Excellent BOS methodology coverage")
-                elif dimension == "specificity":
-                    strengths.append("High specificity and clear language")
-                elif dimension == "measurability":
-                    strengths.append("Strong quantified metrics and measurable outcomes")
-                elif dimension == "actionability":
-                    strengths.append("Clear actionable guidance provided")
-                elif dimension == "consistency":
-                    strengths.append("Consistent terminology and structure")
-                elif dimension == "persona_appropriateness":
-                    strengths.append("Well-aligned with persona needs and expertise")
-                elif dimension == "methodology_compliance":
-                    strengths.append("Strong BOS methodology framework adherence")
-                elif dimension == "business_value":
-                    strengths.append("Clear business value orientation")
-        
-        return strengths
+        return [message for dimension, message in _STRENGTH_MESSAGES
+                if dimension_scores.get(dimension, -1.0) >= threshold]
+
+
+# Engine owned by each batch worker process, created once by the pool initializer
+_batch_worker_engine: Optional[QualityScoringEngine] = None
+
+
+def _init_batch_worker(weights: ScoringWeights) -> None:
+    """Create this worker process's scoring engine with the parent's weights."""
+    global _batch_worker_engine
+    _batch_worker_engine = QualityScoringEngine(weights)
+
+
+def _score_in_batch_worker(pair: Tuple[str, str], detail: bool) -> QualityScore:
+    """Score one (response, persona) pair with this worker process's engine."""
+    response, persona = pair
+    return _batch_worker_engine.calculate_quality_score(response, persona, detail=detail)
 
 
 # Example usage and testing
@@ -710,26 +924,8 @@ def main():
     # Initialize scoring engine
     engine = QualityScoringEngine()
     
-    # Example response to score
-    sample_response = """
-    ✅ Persona Set: Product Owner
-
-    Primary Stakeholder Identified: Senior Loan Officers
-
-    Business context focus with measurable expectations:
-    - Response time: 24 hours for complete application review
-    - Accuracy target: 95% first-pass approval accuracy  
-    - Financial impact: $50,000 revenue risk per delayed application
-
-    Impact categories to analyze:
-    - Financial: Revenue loss potential of $2M annually
-    - Operational: Process efficiency degradation by 30%
-    - Customer Experience: Satisfaction scores drop by 15%
-    - Legal: Compliance violations with regulatory requirements
-
-    Next steps: Complete stakeholder mapping across People/Business Entities/Vendors categories.
-    Use /validate to check current completeness before proceeding to Step 2.
-    """
+    # Example response to score, shared with the comprehensive test runner's samples
+    sample_response = (Path(__file__).with_name("samples") / "product_owner_loan_approval.txt").read_text(encoding="utf-8")
     
     # Calculate quality score
     quality_score = engine.calculate_quality_score(